@@ -3,12 +3,7 @@ Boot script for Raspberry Pi Pico W
 This file runs automatically when the Pico boots up.
 """
 
-from machine import Pin
-
-# Turn on the onboard LED to indicate power
-led = Pin("LED", Pin.OUT)
-led.on()
-
-# Import and run the main web server
+# Import and run the main web server (main.py, precompiled main.mpy, or frozen).
+# The onboard LED is turned on by main() once WiFi is connected.
 import main
-main.main()
\ No newline at end of file
+main.main()
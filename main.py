@@ -5,65 +5,146 @@ BSR Driver IO Remote Control Dashboard
 This script serves a dashboard for remote control of a Raspberry Pi 4.
 """
 
+import errno
+import gc
 import network
+import os
+import select
 import socket
 import time
 from machine import Pin
+from micropython import const
 import sys
 
-# Onboard LED for request indication
-LED = Pin("LED", Pin.OUT)
+# Set to 1 to log every connection and request line over the console
+_DEBUG = const(0)
 
-# Optional in-memory logo (base64 PNG) loaded from `logo_base64.txt` on the Pico
-LOGO_BASE64 = None
+_BANNER = "=" * 50
 
+# Config baked into the firmware by tools/freeze_config.py, if present
+try:
+    import _config_frozen
+except ImportError:
+    _config_frozen = None
 
-def load_logo_base64(filename='logo_base64.txt'):
+# Onboard LED for request indication. On the Pico W it is driven through the
+# CYW43 WiFi chip, so it is only set up once WiFi is running (see main())
+LED = None
+
+# HTTP responses as (headers, body) bytes pairs, built once by build_response_cache()
+_CACHED_INDEX = None
+_CACHED_RESPONSES = {}
+
+# Optional logo PNG response (headers, body), read once from `logo.png` on the Pico flash
+_CACHED_LOGO = None
+
+
+def load_logo(filename='logo.png'):
     """
-    Load base64 PNG data from a file on the Pico (no data: prefix expected).
-    If the file contains a full data URI (data:image/png;base64,...) the prefix
-    will be stripped.
+    Load the raw logo PNG from the Pico filesystem and pre-build its HTTP
+    response so `/logo.png` requests can be served without touching flash.
     """
-    global LOGO_BASE64
+    global _CACHED_LOGO
     try:
-        with open(filename, 'r') as f:
-            data = f.read().strip()
-            if not data:
-                LOGO_BASE64 = None
-                print('Logo file empty')
-                return
-            # Strip data URI prefix if present
-            if data.startswith('data:'):
-                comma = data.find(',')
-                if comma != -1:
-                    data = data[comma+1:]
-            LOGO_BASE64 = data
-            print('Loaded logo_base64, length=', len(data))
+        size = os.stat(filename)[6]
+        if not size:
+            _CACHED_LOGO = None
+            print('Logo file empty')
+            return
+        with open(filename, 'rb') as f:
+            data = f.read()
+        headers = (b"HTTP/1.1 200 OK\r\nContent-Type: image/png\r\nCache-Control: max-age=86400\r\nContent-Length: "
+                   + str(size).encode() + b"\r\n" + _CONNECTION_HEADERS + b"\r\n")
+        _CACHED_LOGO = (headers, data)
+        print('Loaded logo.png, size=', size)
     except Exception as e:
-        LOGO_BASE64 = None
-        print('logo_base64.txt not found or could not be read:', e)
+        _CACHED_LOGO = None
+        print('logo.png not found or could not be read:', e)
 
 # ============================================================================
 # GPIO PIN CONFIGURATION
 # ============================================================================
 # GPIO pin 9 connects to Pi 4 RUN/Reset pins (hardware reset/boot)
-RUN_PIN = 9
+_RUN_PIN = const(9)
+_RUN_PULSE_MS = const(300)  # Pi 4 RUN pin needs a 0.1-0.5s short (using 0.3s middle value)
 
+# Created once at import and held low so the RUN pins stay open until pulsed
+_RUN_PIN_OBJ = Pin(_RUN_PIN, Pin.OUT, value=0)
 
-def blink_led(times=1, duration=0.1):
+# ============================================================================
+# NETWORK CONFIGURATION
+# ============================================================================
+_HTTP_PORT = const(80)          # Web server port
+_LISTEN_BACKLOG = const(16)     # Pending connections queued by listen()
+_ACCEPT_POLL_MS = const(100)    # How long each accept-loop poll waits for a client
+_RECV_SIZE = const(1024)        # Bytes read from each HTTP request
+_REQUEST_TIMEOUT_MS = const(5000)  # Time to wait for a client to send its request
+_KEEPALIVE_TIMEOUT_MS = const(3000)  # Idle time allowed between keep-alive requests
+_KEEPALIVE_MAX = const(5)       # Requests served per connection before closing
+_GC_THRESHOLD = const(8192)     # Bytes allocated before an automatic collection
+_WIFI_TIMEOUT = const(10)       # WiFi connection timeout (seconds)
+_WIFI_POLL_MS = const(100)      # Interval between WiFi connection checks
+_SSH_PORT = const(22)           # Port probed to check if the Pi is online
+_BOOT_PROBE_TIMEOUT_MS = const(3000)  # Safety-check probe timeout before boot
+_STATUS_PROBE_TIMEOUT_MS = const(1000)  # Status-check probe timeout
+_PROBE_CACHE_MS = const(2000)   # How long a status probe result is reused
+
+# Start of every HTML response header; Content-Length follows
+_HTML_HEADERS_START = b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nContent-Length: "
+
+# Sent with every response; must match _KEEPALIVE_TIMEOUT_MS / _KEEPALIVE_MAX
+_CONNECTION_HEADERS = b"Connection: keep-alive\r\nKeep-Alive: timeout=3, max=5\r\n"
+
+# Bodiless reply to anything but GET; the connection is closed after it
+_RESP_NOT_ALLOWED = (b"HTTP/1.1 405 Method Not Allowed\r\nAllow: GET\r\n"
+                     b"Content-Length: 0\r\nConnection: close\r\n\r\n", b'')
+
+# Last Driver IO reachability probe: (time.ticks_ms() timestamp, online), or None
+_last_probe = None
+
+# Resolved (ip, sockaddr) of the Driver IO SSH port and the poller reused by
+# every probe. lwIP sockets cannot reconnect once closed, so the socket itself
+# is still created per probe (at most once per _PROBE_CACHE_MS for /status).
+_probe_addr = None
+_probe_poller = select.poll()
+
+# driverio_config.txt keys -> config dict fields
+_DRIVERIO_KEYS = {
+    b'DRIVERIO_IP': 'ip',
+    b'DRIVERIO_USER': 'user',
+    b'DRIVERIO_PASS': 'pass',
+    b'PASSCODE': 'passcode',
+}
+
+# Parsed config files, re-read only when the file's mtime changes
+_cfg_cache = {'mtime': -1, 'data': {}}
+_wifi_cache = {'mtime': -1, 'data': (None, None)}
+
+
+def _file_mtime(filename):
+    """
+    Get the modification time of a file, or None if it cannot be stat'ed.
+    """
+    try:
+        return os.stat(filename)[8]
+    except OSError:
+        return None
+
+
+def blink_led(times=1, duration_ms=100):
     """
     Blink the onboard LED to indicate activity.
     
     Args:
         times: Number of blinks
-        duration: Duration of each blink in seconds
+        duration_ms: Duration of each blink in milliseconds
     """
     for _ in range(times):
         LED.on()
-        time.sleep(duration)
+        time.sleep_ms(duration_ms)
         LED.off()
         if times > 1:
-            time.sleep(duration)
+            time.sleep_ms(duration_ms)
 
 
 def read_driverio_config(filename='driverio_config.txt'):
@@ -74,27 +155,38 @@ def read_driverio_config(filename='driverio_config.txt'):
     DRIVERIO_USER=username
     DRIVERIO_PASS=password
     
+    The parsed result is cached and only re-read when the file changes.
+    If the config was frozen into the firmware, the file is not read at all.
+    
     Returns:
-        dict: Configuration with keys 'ip', 'user', 'pass'
+        dict: Configuration with keys 'ip', 'user', 'pass' and 'passcode' (bytes)
     """
+    if _config_frozen:
+        return _config_frozen.DRIVERIO
+    
+    mtime = _file_mtime(filename)
+    if mtime is not None and mtime == _cfg_cache['mtime']:
+        return _cfg_cache['data']
+    
     config = {}
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        if key == 'DRIVERIO_IP':
-                            config['ip'] = value
-                        elif key == 'DRIVERIO_USER':
-                            config['user'] = value
-                        elif key == 'DRIVERIO_PASS':
-                            config['pass'] = value
-                        elif key == 'PASSCODE':
-                            config['passcode'] = value
+        # Read the whole (tiny) file at once and only decode the values used
+        with open(filename, 'rb') as f:
+            data = f.read()
+        for line in data.split(b'\n'):
+            line = line.strip()
+            if not line or line[:1] == b'#':
+                continue
+            key, sep, value = line.partition(b'=')
+            field = _DRIVERIO_KEYS.get(key)
+            if sep and field:
+                # The passcode stays bytes to compare against the raw request
+                config[field] = value if field == 'passcode' else value.decode()
     except Exception as e:
         print(f"Error reading Driver IO config: {e}")
+    
+    _cfg_cache['mtime'] = -1 if mtime is None else mtime
+    _cfg_cache['data'] = config
     return config
 
 
@@ -106,31 +198,43 @@ def parse_wifi_config(filename="wifi_config.txt"):
     SSID=your_wifi_ssid
     PASSWORD=your_wifi_password
     
+    Uses the credentials frozen into the firmware instead, if present.
+    
     Args:
         filename: Path to the WiFi configuration file
         
     Returns:
         tuple: (ssid, password)
     """
+    if _config_frozen:
+        return _config_frozen.WIFI['ssid'], _config_frozen.WIFI['password']
+    
+    mtime = _file_mtime(filename)
+    if mtime is not None and mtime == _wifi_cache['mtime']:
+        return _wifi_cache['data']
+    
     ssid = None
     password = None
     
     try:
-        with open(filename, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("SSID="):
-                    ssid = line[5:]
-                elif line.startswith("PASSWORD="):
-                    password = line[9:]
+        with open(filename, "rb") as f:
+            data = f.read()
+        for line in data.split(b"\n"):
+            line = line.strip()
+            if line.startswith(b"SSID="):
+                ssid = line[5:].decode()
+            elif line.startswith(b"PASSWORD="):
+                password = line[9:].decode()
     except OSError:
         print(f"Error: Could not read {filename}")
         return None, None
     
+    _wifi_cache['mtime'] = -1 if mtime is None else mtime
+    _wifi_cache['data'] = (ssid, password)
     return ssid, password
 
 
-def connect_wifi(ssid, password, timeout=10):
+def connect_wifi(ssid, password, timeout=_WIFI_TIMEOUT):
     """
     Connect to a WiFi network.
     
@@ -152,12 +256,12 @@ def connect_wifi(ssid, password, timeout=10):
     print(f"Connecting to WiFi: {ssid}")
     wlan.connect(ssid, password)
     
-    start_time = time.time()
+    start = time.ticks_ms()
     while not wlan.isconnected():
-        if time.time() - start_time > timeout:
+        if time.ticks_diff(time.ticks_ms(), start) > timeout * 1000:
             print("WiFi connection timeout")
             return None
-        time.sleep(0.5)
+        time.sleep_ms(_WIFI_POLL_MS)
         print(".", end="")
     
     ip_address = wlan.ifconfig()[0]
@@ -165,19 +269,11 @@ def connect_wifi(ssid, password, timeout=10):
     return ip_address
 
 
-def get_html_page():
-    """
-    Generate the HTML page for the dashboard.
-    
-    Returns:
-        str: HTML content
-    """
-    # Build logo HTML if available
-    logo_html = ''
-    if LOGO_BASE64:
-        logo_html = '<img src="data:image/png;base64,' + LOGO_BASE64 + '" alt="BSR Logo" style="width:80px;height:80px;margin-bottom:20px;">'
-
-    html = """<!DOCTYPE html>
+# ============================================================================
+# HTML TEMPLATES
+# ============================================================================
+# Dashboard page, split around the optional logo <img> tag
+_INDEX_HTML_A = b"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -264,44 +360,19 @@ def get_html_page():
     </script>
 </head>
 <body>
-    """ + logo_html + """
+    """
+
+_INDEX_HTML_B = b"""
     <h1>BSR Driver IO Remote Control</h1>
     <div class="button-container">
-        <a href="#" onclick="return handleAction('/boot')" class="btn btn-boot">⏻ Boot up Pi</a>
-        <a href="#" onclick="return handleAction('/status')" class="btn btn-status">ــہہـ٨ــ Check Driver IO Status</a>
+        <a href="#" onclick="return handleAction('/boot')" class="btn btn-boot">&#x23FB; Boot up Pi</a>
+        <a href="#" onclick="return handleAction('/status')" class="btn btn-status">&#x0640;&#x0640;&#x06C1;&#x06C1;&#x0640;&#x0668;&#x0640;&#x0640; Check Driver IO Status</a>
     </div>
 </body>
 </html>"""
-    return html
 
-
-def get_response_page(action):
-    """
-    Generate a response page after an action is triggered.
-    
-    Args:
-        action: The action that was triggered ('boot', 'reboot', or 'shutdown')
-        
-    Returns:
-        str: HTML content
-    """
-    # Determine if this is an unauthorized access
-    is_unauthorized = (action == "unauthorized")
-    
-    if action == "boot":
-        action_text = "Boot up Pi - RUN Pin Triggered"
-    elif action == "boot_already_online":
-        action_text = "Pi is Already Online - Boot Aborted"
-    elif action == "status":
-        action_text = "Status Check - Driver IO is ONLINE"
-    elif action == "status_offline":
-        action_text = "Status Check - Driver IO is OFFLINE"
-    elif action == "unauthorized":
-        action_text = "Invalid Passcode"
-    else:
-        action_text = "Unknown Action"
-    
-    html = f"""<!DOCTYPE html>
+# Response page, assembled from these fragments by get_response_page()
+_RESP_PROLOGUE = b"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -309,7 +380,7 @@ def get_response_page(action):
     <meta http-equiv="refresh" content="3;url=/">
     <title>BSR Driver IO Remote Control</title>
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             background-color: #000000;
             color: #FFFFFF;
@@ -319,47 +390,144 @@ def get_response_page(action):
             align-items: center;
             justify-content: center;
             padding: 20px;
-        }}
-        h1 {{
+        }
+        h1 {
             color: #FFFFFF;
             margin-bottom: 20px;
-        }}
-        .message {{
+        }
+        .message {
             background-color: #1a1a1a;
             border: 2px solid #FFFFFF;
             padding: 20px 40px;
             border-radius: 10px;
             text-align: center;
-        }}
-        .success {{
+        }
+        .success {
             color: #28a745;
             font-weight: bold;
-        }}
-        .error {{
+        }
+        .error {
             color: #FF0000;
             font-weight: bold;
             font-size: 1.2em;
-        }}
+        }
     </style>
 </head>
 <body>
     <h1>BSR Driver IO Remote Control</h1>
     <div class="message">"""
-    
-    if is_unauthorized:
-        html += f"""
+
+_RESP_DENIED = b"""
         <p class="error">INCORRECT PASSCODE</p>
         <p>Access denied. Redirecting back to dashboard...</p>"""
-    else:
-        html += f"""
-        <p class="success">Command sent: {action_text}</p>
+
+_RESP_OK_HEAD = b"""
+        <p class="success">Command sent: """
+
+_RESP_OK_TAIL = b"""</p>
         <p>Redirecting back to dashboard...</p>"""
-    
-    html += """
+
+_RESP_EPILOGUE = b"""
     </div>
 </body>
 </html>"""
-    return html
+
+
+def get_html_page():
+    """
+    Generate the HTML page for the dashboard.
+    
+    Returns:
+        bytes: HTML content
+    """
+    # Reference the logo endpoint if a logo was loaded
+    logo_html = b''
+    if _CACHED_LOGO:
+        logo_html = b'<img src="/logo.png" alt="BSR Logo" style="width:80px;height:80px;margin-bottom:20px;">'
+
+    return b"".join([_INDEX_HTML_A, logo_html, _INDEX_HTML_B])
+
+
+def get_response_page(action):
+    """
+    Generate a response page after an action is triggered.
+    
+    Args:
+        action: The action that was triggered ('boot', 'reboot', or 'shutdown')
+        
+    Returns:
+        bytes: HTML content
+    """
+    # Determine if this is an unauthorized access
+    is_unauthorized = (action == "unauthorized")
+    
+    if action == "boot":
+        action_text = "Boot up Pi - RUN Pin Triggered"
+    elif action == "boot_already_online":
+        action_text = "Pi is Already Online - Boot Aborted"
+    elif action == "status":
+        action_text = "Status Check - Driver IO is ONLINE"
+    elif action == "status_offline":
+        action_text = "Status Check - Driver IO is OFFLINE"
+    elif action == "unauthorized":
+        action_text = "Invalid Passcode"
+    else:
+        action_text = "Unknown Action"
+    
+    # Append fragments into one buffer instead of growing a string with +=
+    buf = bytearray(_RESP_PROLOGUE)
+    if is_unauthorized:
+        buf += _RESP_DENIED
+    else:
+        buf += _RESP_OK_HEAD
+        buf += action_text.encode()
+        buf += _RESP_OK_TAIL
+    buf += _RESP_EPILOGUE
+    return bytes(buf)
+
+
+def _http_response(body):
+    """
+    Pair an encoded HTML body with its HTTP/1.1 200 headers.
+    
+    The two are kept separate so the body never has to be copied into a
+    combined buffer; send_response() writes them one after the other.
+    
+    Args:
+        body: Encoded HTML content (bytes)
+        
+    Returns:
+        tuple: (headers, body) as bytes
+    """
+    headers = (_HTML_HEADERS_START + str(len(body)).encode() + b"\r\n"
+               + _CONNECTION_HEADERS + b"\r\n")
+    return headers, body
+
+
+def build_response_cache():
+    """
+    Render the dashboard and every response page once and store them as
+    pre-encoded HTTP responses, so requests only need a dict lookup.
+    
+    Call again if the logo changes to regenerate the dashboard.
+    """
+    global _CACHED_INDEX
+    _CACHED_INDEX = _http_response(get_html_page())
+    for action in ('boot', 'boot_already_online', 'status', 'status_offline', 'unauthorized'):
+        _CACHED_RESPONSES[action] = _http_response(get_response_page(action))
+
+
+def _ct_eq(a, b):
+    """
+    Compare two byte strings in constant time (for equal lengths), so the
+    comparison does not leak how many leading bytes matched.
+    """
+    if len(a) != len(b):
+        return False
+    result = 0
+    for x, y in zip(a, b):
+        result |= x ^ y
+    return result == 0
 
 
 def verify_passcode(provided_passcode):
@@ -367,19 +535,19 @@ def verify_passcode(provided_passcode):
     Verify the provided passcode against the configured passcode.
     
     Args:
-        provided_passcode: The passcode provided by the user
+        provided_passcode: The passcode provided by the user (bytes or None)
         
     Returns:
         bool: True if passcode matches, False otherwise
     """
     config = read_driverio_config()
-    correct_passcode = config.get('passcode', '')
+    correct_passcode = config.get('passcode', b'')
     
     if not correct_passcode:
         print("WARNING: No passcode configured, allowing access")
         return True
     
-    if provided_passcode == correct_passcode:
+    if _ct_eq(provided_passcode or b'', correct_passcode):
         print("Passcode verified")
         return True
     else:
@@ -387,6 +555,65 @@ def verify_passcode(provided_passcode):
         return False
 
 
+def probe_driverio(driverio_ip, timeout_ms):
+    """
+    Check whether the Driver IO is reachable by connecting to its SSH port.
+    
+    The connect is non-blocking and polled for writability, so the probe
+    never waits longer than `timeout_ms`. The result is remembered in
+    `_last_probe` for handle_status().
+    
+    Args:
+        driverio_ip: IP address of the Driver IO (Pi 4)
+        timeout_ms: Connection timeout in milliseconds
+        
+    Returns:
+        bool: True if the Driver IO accepted the connection
+    """
+    global _last_probe, _probe_addr
+    test_sock = None
+    try:
+        if not _probe_addr or _probe_addr[0] != driverio_ip:
+            _probe_addr = (driverio_ip, socket.getaddrinfo(driverio_ip, _SSH_PORT)[0][-1])
+        
+        test_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        test_sock.setblocking(False)
+        try:
+            test_sock.connect(_probe_addr[1])  # Test SSH port
+        except OSError as e:
+            if e.errno != errno.EINPROGRESS:
+                raise
+        
+        # Always unregister, so a failed probe never leaves its closed
+        # socket in the shared poller for the next probe to trip over
+        _probe_poller.register(test_sock, select.POLLOUT)
+        try:
+            events = _probe_poller.poll(timeout_ms)
+        finally:
+            _probe_poller.unregister(test_sock)
+        
+        online = False
+        for entry in events:
+            if entry[0] is test_sock:
+                online = not (entry[1] & (select.POLLERR | select.POLLHUP))
+    except Exception as e:
+        print(f"Probe of {driverio_ip} failed (Pi likely offline): {e}")
+        online = False
+    if test_sock:
+        test_sock.close()
+    _last_probe = (time.ticks_ms(), online)
+    return online
+
+
+def pulse_run_pin():
+    """
+    Short the Pi 4 RUN/Reset pins for _RUN_PULSE_MS to boot it up.
+    """
+    _RUN_PIN_OBJ.value(1)
+    time.sleep_ms(_RUN_PULSE_MS)
+    _RUN_PIN_OBJ.value(0)
+
+
 def handle_boot_pi():
     """
     Handle the Boot up Pi action (RUN/Reset pin trigger).
@@ -410,27 +637,20 @@ def handle_boot_pi():
     
     driverio_ip = config['ip']
     
-    # Safety check: Ping the Pi first
+    # Safety check: Ping the Pi first (always a fresh probe, never cached)
     print(f"Safety check: Pinging {driverio_ip} to verify Pi is offline...")
-    try:
-        test_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        test_sock.settimeout(3)
-        result = test_sock.connect_ex((driverio_ip, 22))  # Test SSH port
-        test_sock.close()
-        
-        if result == 0:
-            print(f"Pi at {driverio_ip} is already ONLINE - aborting boot command")
-            return 'already_online'
-    except Exception as e:
-        print(f"Ping test failed (Pi likely offline): {e}")
+    if probe_driverio(driverio_ip, _BOOT_PROBE_TIMEOUT_MS):
+        print(f"Pi at {driverio_ip} is already ONLINE - aborting boot command")
+        return 'already_online'
     
     # Pi is offline, safe to trigger RUN pin
     print("Pi is offline, triggering RUN/Reset pin to boot up...")
-    reboot_pin = Pin(RUN_PIN, Pin.OUT)
-    reboot_pin.value(1)
-    time.sleep(0.3)  # Short for 0.1-0.5s as per Pi 4 spec (using 0.3s middle value)
-    reboot_pin.value(0)
+    pulse_run_pin()
     print("RUN/Reset signal sent (0.3s) - Pi should boot up now")
+    
+    # The Pi's state is changing, so the last probe result is stale
+    global _last_probe
+    _last_probe = None
     return 'booted'
 
 
@@ -439,10 +659,15 @@ def handle_status():
     Handle the Status Check action.
     
     This function checks if the Driver IO (Pi 4) board is online and reachable.
-    Does NOT trigger any GPIO pins or perform any actions.
+    Does NOT trigger any GPIO pins or perform any actions. A probe result
+    from the last _PROBE_CACHE_MS is reused so repeated checks return instantly.
     """
     print("Status check command received")
     
+    if _last_probe and time.ticks_diff(time.ticks_ms(), _last_probe[0]) < _PROBE_CACHE_MS:
+        print("Using cached status check result")
+        return _last_probe[1]
+    
     # Read Driver IO config
     config = read_driverio_config()
     
@@ -457,28 +682,167 @@ def handle_status():
     print(f"Attempting to shutdown Driver IO at {driverio_ip}")
     
     # Try to test connectivity to the Driver IO board
+    if probe_driverio(driverio_ip, _STATUS_PROBE_TIMEOUT_MS):
+        print(f"Driver IO at {driverio_ip} is ONLINE and reachable")
+        print("Boot sequence successful - Pi 4 is responding")
+        return True
+    else:
+        print(f"Driver IO at {driverio_ip} is OFFLINE or not reachable")
+        return False
+
+
+def route_boot(passcode):
+    """
+    Handle GET /boot: verify the passcode, then run the boot sequence.
+    
+    Returns:
+        tuple: Pre-built (headers, body) HTTP response
+    """
+    if _DEBUG:
+        print("Boot up Pi endpoint hit")
+    if not verify_passcode(passcode):
+        return _CACHED_RESPONSES['unauthorized']
+    status = handle_boot_pi()
+    if status == 'already_online':
+        return _CACHED_RESPONSES['boot_already_online']
+    return _CACHED_RESPONSES['boot']  # Booted, or error case
+
+
+def route_status(passcode):
+    """
+    Handle GET /status: verify the passcode, then check the Driver IO.
+    
+    Returns:
+        tuple: Pre-built (headers, body) HTTP response
+    """
+    if _DEBUG:
+        print("Status check endpoint hit")
+    if not verify_passcode(passcode):
+        return _CACHED_RESPONSES['unauthorized']
+    return _CACHED_RESPONSES['status' if handle_status() else 'status_offline']
+
+
+def route_logo(passcode):
+    """
+    Handle GET /logo.png (falls back to the dashboard if no logo is loaded).
+    
+    Returns:
+        tuple: Pre-built (headers, body) HTTP response
+    """
+    return _CACHED_LOGO or _CACHED_INDEX
+
+
+# Request path -> route handler; anything else serves the dashboard
+_ROUTES = {
+    b'/boot': route_boot,
+    b'/status': route_status,
+    b'/logo.png': route_logo,
+}
+
+
+def send_bytes(client, data):
+    """
+    Send all of `data`, slicing a memoryview on partial sends so the
+    remaining bytes are never copied.
+    """
+    mv = memoryview(data)
+    sent = 0
+    while sent < len(mv):
+        sent += client.send(mv[sent:])
+
+
+def send_response(client, response):
+    """
+    Send a pre-built (headers, body) response to the client.
+    """
+    headers, body = response
+    send_bytes(client, headers)
+    send_bytes(client, body)
+
+
+def read_request_line(client, buf, poller, timeout_ms=_REQUEST_TIMEOUT_MS, listener=None):
+    """
+    Read the start of an HTTP request into a reusable buffer.
+    
+    Waits for the client to send data, then reads whatever has arrived
+    without blocking (readinto() on a blocking socket waits for the whole
+    buffer to fill). Only the request line is copied out of the buffer.
+    
+    If `listener` is given it is polled as well, and the wait ends early
+    when a new connection is pending, so an idle keep-alive client cannot
+    hold up the next one.
+    
+    Args:
+        client: Connected client socket
+        buf: Preallocated bytearray to receive into
+        poller: select.poll object used to wait for the client
+        timeout_ms: How long to wait for the request to arrive
+        listener: Optional listening socket to watch for new connections
+        
+    Returns:
+        tuple: (request line without the trailing CRLF, bytes received,
+                whether the whole request header arrived);
+               (b'', 0, False) if nothing arrived, the client closed, or
+               another client is waiting
+    """
+    poller.register(client, select.POLLIN)
+    if listener is not None:
+        poller.register(listener, select.POLLIN)
+    ready = poller.poll(timeout_ms)
+    poller.unregister(client)
+    if listener is not None:
+        poller.unregister(listener)
+    
+    for entry in ready:
+        if entry[0] is client:
+            break
+    else:
+        return b'', 0, False
+    
+    client.setblocking(False)
+    n = client.readinto(buf) or 0
+    client.setblocking(True)
+    
+    end = 0
+    while end < n and buf[end] != 13:  # b'\r'
+        end += 1
+    # Anything short of the blank line leaves unread headers on the socket
+    complete = n >= 4 and buf[n - 4:n] == b'\r\n\r\n'
+    return bytes(memoryview(buf)[:end]), n, complete
+
+
+def handle_request(request_line):
+    """
+    Route a single HTTP request line to its handler.
+    
+    Args:
+        request_line: e.g. b'GET /status?passcode=123456 HTTP/1.1'
+        
+    Returns:
+        tuple: Pre-built (headers, body) HTTP response to send;
+               _RESP_NOT_ALLOWED for any method other than GET
+    """
     try:
-        # Create a socket to test connectivity on SSH port
-        test_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        test_sock.settimeout(5)
-        result = test_sock.connect_ex((driverio_ip, 22))  # Test SSH port
-        test_sock.close()
+        # "GET /path?query HTTP/1.1" -> method, path, query
+        method, _, rest = request_line.partition(b' ')
+        target, _, _ = rest.partition(b' ')
+        path, _, query = target.partition(b'?')
         
-        if result == 0:
-            print(f"Driver IO at {driverio_ip} is ONLINE and reachable")
-            print("Boot sequence successful - Pi 4 is responding")
-            return True
-        else:
-            print(f"Driver IO at {driverio_ip} is OFFLINE or not reachable")
-            return False
-            
-    except Exception as e:
-        print(f"Error connecting to Driver IO: {e}")
-        sys.print_exception(e)
-        return False
+        # Extract passcode from query string (kept as bytes)
+        passcode = None
+        if query.startswith(b'passcode='):
+            passcode = query[9:]
+        
+        if method != b'GET':
+            return _RESP_NOT_ALLOWED
+        
+        route = _ROUTES.get(path)
+        return route(passcode) if route else _CACHED_INDEX
+    except (IndexError, ValueError):
+        return _CACHED_INDEX
 
 
-def start_server(ip_address, port=80):
+def start_server(ip_address, port=_HTTP_PORT):
     """
     Start the web server.
     
@@ -489,63 +853,59 @@ def start_server(ip_address, port=80):
     server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     server_socket.bind(('', port))
-    server_socket.listen(5)
+    server_socket.listen(_LISTEN_BACKLOG)
+    
+    # Wait for clients with poll() instead of blocking in accept()
+    server_socket.setblocking(False)
+    server_poller = select.poll()
+    server_poller.register(server_socket, select.POLLIN)
     
     print(f"Web server running on http://{ip_address}:{port}")
     print("Press Ctrl+C to stop the server")
     
+    # Reused for every request to avoid per-request allocations
+    recv_buf = bytearray(_RECV_SIZE)
+    client_poller = select.poll()
+    
     while True:
         try:
+            if not server_poller.poll(_ACCEPT_POLL_MS):
+                continue
             client, client_addr = server_socket.accept()
-            print(f"Connection from {client_addr}")
+            client.setblocking(True)
+            if _DEBUG:
+                print("Connection from", client_addr)
             
             # Blink LED to indicate request received
             blink_led()
             
-            request = client.recv(1024).decode("utf-8")
-            
-            # Parse the request to get the path
-            try:
-                request_line = request.split("\r\n")[0]
-                print(f"Request: {request_line}")
+            # Serve up to _KEEPALIVE_MAX requests (e.g. page + logo) per connection
+            # Only the first wait ignores the listener; later waits give
+            # way to any new connection so one idle client can't block others
+            timeout_ms = _REQUEST_TIMEOUT_MS
+            listener = None
+            for _ in range(_KEEPALIVE_MAX):
+                request_line, n, complete = read_request_line(
+                    client, recv_buf, client_poller, timeout_ms, listener)
+                if not n:
+                    break
+                if _DEBUG:
+                    print("Request:", request_line)
+                response = handle_request(request_line)
+                send_response(client, response)
                 
-                # Extract passcode from query string
-                passcode = None
-                if '?passcode=' in request_line:
-                    try:
-                        passcode = request_line.split('?passcode=')[1].split(' ')[0]
-                    except:
-                        pass
-                
-                if request_line.startswith('GET /boot'):
-                    print("Boot up Pi endpoint hit")
-                    if verify_passcode(passcode):
-                        status = handle_boot_pi()
-                        if status == 'already_online':
-                            response = get_response_page('boot_already_online')
-                        elif status == 'booted':
-                            response = get_response_page('boot')
-                        else:
-                            response = get_response_page('boot')  # Error case
-                    else:
-                        response = get_response_page('unauthorized')
-                elif request_line.startswith('GET /status'):
-                    print("Status check endpoint hit")
-                    if verify_passcode(passcode):
-                        success = handle_status()
-                        response = get_response_page('status' if success else 'status_offline')
-                    else:
-                        response = get_response_page('unauthorized')
-                else:
-                    response = get_html_page()
-            except (IndexError, ValueError):
-                response = get_html_page()
-            
-            # Send HTTP response
-            http_response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nConnection: close\r\n\r\n" + response
-            client.sendall(http_response.encode("utf-8"))
+                # Unread headers or a body would be misread as the next request
+                if not complete or response is _RESP_NOT_ALLOWED:
+                    break
+                timeout_ms = _KEEPALIVE_TIMEOUT_MS
+                listener = server_socket
             client.close()
             
+            # Collect now, while idle, rather than mid-request
+            gc.collect()
+            if _DEBUG:
+                print("Free memory:", gc.mem_free())
+            
         except Exception as e:
             print(f"Error handling request: {e}")
             sys.print_exception(e)
@@ -560,9 +920,9 @@ def main():
     Main entry point for the application.
     """
     try:
-        print("=" * 50)
+        print(_BANNER)
         print("BSR Driver IO Remote Control Dashboard")
-        print("=" * 50)
+        print(_BANNER)
         
         # Parse WiFi credentials from config file
         ssid, password = parse_wifi_config()
@@ -581,8 +941,19 @@ def main():
             print("Error: Could not connect to WiFi")
             return
         
-        # Load optional logo (base64) if present on the Pico
-        load_logo_base64('logo_base64.txt')
+        # Collect in small, frequent steps to limit heap fragmentation
+        gc.threshold(_GC_THRESHOLD)
+        
+        # Turn on the onboard LED now that the CYW43 driver is up
+        global LED
+        LED = Pin("LED", Pin.OUT)
+        LED.on()
+        
+        # Load optional logo PNG if present on the Pico
+        load_logo('logo.png')
+
+        # Render all pages once so requests only send pre-encoded bytes
+        build_response_cache()
 
         # Start the web server
         start_server(ip_address)
@@ -6,33 +6,25 @@ This creates a simple HTTP server that serves the HTML from main.py
 
 import sys
 import os
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import urllib.parse
-
-# Add parent directory to path to import main.py functions
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Read the logo base64 data
-LOGO_BASE64 = None
-try:
-    with open('logo_base64.txt', 'r') as f:
-        data = f.read().strip()
-        if data.startswith('data:'):
-            comma = data.find(',')
-            if comma != -1:
-                data = data[comma+1:]
-        LOGO_BASE64 = data
-        print(f"✓ Loaded logo ({len(data)} bytes)")
-except:
-    print("⚠ No logo_base64.txt found (optional)")
-
-def get_html_page():
-    """Generate the main dashboard HTML"""
-    logo_html = ''
-    if LOGO_BASE64:
-        logo_html = f'<img src="data:image/png;base64,{LOGO_BASE64}" alt="BSR Logo" style="width:80px;height:80px;margin-bottom:20px;">'
-
-    html = """<!DOCTYPE html>
+import functools
+import hashlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+# Logo PNG on disk, streamed to the browser with sendfile()
+_LOGO_PATH = 'logo.png'
+
+
+def _logo_exists():
+    """Check logo.png is on disk right now; the dashboard and /logo.png both ask"""
+    return os.path.isfile(_LOGO_PATH)
+
+
+# The logo is served from /logo.png, like main.py does on the Pico
+_LOGO_HTML = '<img src="/logo.png" alt="BSR Logo" style="width:80px;height:80px;margin-bottom:20px;">'
+
+# Dashboard template; the single %s placeholder takes the logo tag
+_TMPL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -64,7 +56,7 @@ def get_html_page():
             display: flex;
             flex-direction: column;
             gap: 40px;
-            width: 100%;
+            width: 100%%;
             max-width: 300px;
         }
         .btn {
@@ -110,7 +102,7 @@ def get_html_page():
     </script>
 </head>
 <body>
-    """ + logo_html + """
+    %s
     <h1>BSR Driver IO Remote Control</h1>
     <div class="button-container">
         <a href="#" onclick="return handleAction('/boot')" class="btn btn-boot">⏻ Boot up Pi</a>
@@ -118,11 +110,71 @@ def get_html_page():
     </div>
 </body>
 </html>"""
-    return html
 
 
+def get_html_page(with_logo=True):
+    """Generate the main dashboard HTML, with or without the logo tag"""
+    return _TMPL % (_LOGO_HTML if with_logo else '')
+
+
+def _etag(body):
+    """Strong ETag for a cached body"""
+    return '"' + hashlib.md5(body).hexdigest() + '"'
+
+
+def _html_response(status, body, *headers):
+    """Precompute a (status, headers, body, etag) entry for an HTML body"""
+    return (status,
+            (('Content-Type', 'text/html; charset=utf-8'),
+             ('Content-Length', str(len(body))),
+             ('Connection', 'keep-alive')) + headers,
+            body,
+            dict(headers).get('ETag'))
+
+
+# (path, passcode_ok) -> (status, headers, body, etag) for the action pages,
+# and logo present -> the same for the dashboard; _build_caches() fills
+# them once from main()
+_PRECOMPUTED = {}
+_DASHBOARDS = {}
+
+# Minimal response for unknown paths
+_NOT_FOUND = _html_response(404, b'Not Found')
+
+
+def _build_caches():
+    """Render and encode every HTML response"""
+    for has_logo in (True, False):
+        html = get_html_page(has_logo).encode('utf-8')
+        _DASHBOARDS[has_logo] = _html_response(200, html, ('ETag', _etag(html)),
+                                               ('Cache-Control', 'public, max-age=3600'))
+    for ok in (True, False):
+        for action in ('boot', 'status'):
+            _PRECOMPUTED[('/' + action, ok)] = _html_response(200, get_response_page(action, ok))
+
+
+# Set PREVIEW_LOG=0 to silence per-request logging
+_LOG_ENABLED = os.environ.get('PREVIEW_LOG', '1') != '0'
+
+# Demo passcode accepted by the preview server
+_TEST_PASSCODE = '123456'
+
+
+def _passcode_valid(passcode):
+    """Check the passcode is 6 ASCII digits, as the page enforces"""
+    # isdigit() alone also accepts non-ASCII digits such as '١'
+    return (passcode is not None and len(passcode) == 6
+            and passcode.isascii() and passcode.isdigit())
+
+
+def _passcode_ok(passcode):
+    """Check the passcode is well-formed and matches the demo one"""
+    return _passcode_valid(passcode) and passcode == _TEST_PASSCODE
+
+
+@functools.lru_cache(maxsize=16)
 def get_response_page(action, passcode_correct=True):
-    """Generate response page for preview"""
+    """Generate response page for preview (memoized, returns encoded bytes)"""
     is_unauthorized = not passcode_correct
     
     if action == "boot":
@@ -190,51 +242,118 @@ def get_response_page(action, passcode_correct=True):
     </div>
 </body>
 </html>"""
-    return html
+    return html.encode('utf-8')
 
 
 class PreviewHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests; every response sends Content-Length
+    protocol_version = 'HTTP/1.1'
+
+    # Buffer writes so headers and the whole page go out in one send()
+    wbufsize = 65536
+
     def log_message(self, format, *args):
-        """Custom logging"""
-        print(f"[{self.address_string()}] {format % args}")
+        """Custom logging (written piecewise to stderr, like the default handler)"""
+        if not _LOG_ENABLED:
+            return
+        write = sys.stderr.write
+        write('[')
+        write(self.address_string())
+        write('] ')
+        write(format % args)
+        write('\n')
+
+    def _send(self, status, headers, body):
+        """Write a precomputed response"""
+        self.send_response(status)
+        for keyword, value in headers:
+            self.send_header(keyword, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_modified(self, etag):
+        """Answer 304 if the browser already has the current version"""
+        if etag and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return True
+        return False
+
+    def _serve_logo(self):
+        """Logo PNG; cached by the browser for a year"""
+        try:
+            f = open(_LOGO_PATH, 'rb')
+        except OSError:
+            self._send(*_NOT_FOUND[:3])
+            return
+        with f:
+            # Size + mtime of the file actually sent, so the PNG never has
+            # to be read into memory and the headers always match it
+            st = os.fstat(f.fileno())
+            etag = '"%x-%x"' % (st.st_mtime_ns, st.st_size)
+            if self._not_modified(etag):
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', str(st.st_size))
+            self.send_header('Connection', 'keep-alive')
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+            self.end_headers()
+            # Headers must leave the write buffer before the kernel sends the file
+            self.wfile.flush()
+            self.connection.sendfile(f, 0, st.st_size)
 
     def do_GET(self):
-        parsed_path = urllib.parse.urlparse(self.path)
-        path = parsed_path.path
-        query = urllib.parse.parse_qs(parsed_path.query)
+        # Split "/path?query" by hand; passcode is the only parameter used
+        raw = self.path
+        i = raw.find('?')
+        path = raw if i < 0 else raw[:i]
+        qs = '' if i < 0 else raw[i+1:]
+        
+        if path == '/logo.png':
+            self._serve_logo()
+            return
         
         # Extract passcode if provided
-        passcode = query.get('passcode', [None])[0]
+        passcode = None
+        for pair in qs.split('&'):
+            if pair.startswith('passcode='):
+                passcode = pair[9:]
+                break
         
-        if path == '/boot':
-            # Simulate boot response (check if passcode is 123456 for demo)
-            passcode_correct = (passcode == '123456')
-            html = get_response_page('boot', passcode_correct)
-        elif path == '/status':
-            # Simulate status response
-            passcode_correct = (passcode == '123456')
-            html = get_response_page('status', passcode_correct)
+        # Every HTML response was built up front; one lookup picks it.
+        # The dashboard shows the logo only if /logo.png can serve it now
+        if path == '/':
+            status, headers, body, etag = _DASHBOARDS[_logo_exists()]
         else:
-            # Main dashboard
-            html = get_html_page()
-        
-        # Send response
-        self.send_response(200)
-        self.send_header('Content-Type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html.encode('utf-8'))
+            status, headers, body, etag = _PRECOMPUTED.get(
+                (path, _passcode_ok(passcode)), _NOT_FOUND)
+        if not self._not_modified(etag):
+            self._send(status, headers, body)
+
+
+class PreviewServer(ThreadingHTTPServer):
+    # listen() backlog; must be set on the class since it is used in __init__
+    request_queue_size = 128
 
 
 def main():
     """Start preview server"""
     port = 8080
-    server = HTTPServer(('localhost', port), PreviewHandler)
+    _build_caches()
+    server = PreviewServer(('localhost', port), PreviewHandler)
     
     print("=" * 60)
     print("🌐 Pico Web Interface Preview Server")
     print("=" * 60)
     print(f"\n✓ Server running at: http://localhost:{port}")
-    print(f"✓ Test passcode: 123456")
+    print(f"✓ Test passcode: {_TEST_PASSCODE}")
+    if _logo_exists():
+        print("✓ Serving logo.png")
+    else:
+        print("⚠ No logo.png found (optional)")
     print(f"\n📝 Press Ctrl+C to stop the server\n")
     
     try:
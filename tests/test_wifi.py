@@ -10,13 +10,14 @@ def parse_wifi_config(filename="wifi_config.txt"):
     password = None
     
     try:
-        with open(filename, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("SSID="):
-                    ssid = line[5:]
-                elif line.startswith("PASSWORD="):
-                    password = line[9:]
+        with open(filename, "rb") as f:
+            blob = f.read()
+        for line in blob.splitlines():
+            line = line.strip()
+            if line.startswith(b"SSID="):
+                ssid = line[5:].decode("utf-8")
+            elif line.startswith(b"PASSWORD="):
+                password = line[9:].decode("utf-8")
     except OSError as e:
         print(f"Error reading {filename}: {e}")
         return None, None
@@ -41,16 +42,19 @@ else:
     print(f"Connecting to {ssid}...")
     wlan.connect(ssid, password)
     
-    # Wait for connection
-    max_wait = 10
-    while max_wait > 0:
+    # Wait up to 10 s for connection, polling quickly at first and backing off
+    deadline = time.ticks_add(time.ticks_ms(), 10_000)
+    delay = 20
+    dots = 0
+    while time.ticks_diff(deadline, time.ticks_ms()) > 0:
         if wlan.isconnected():
             break
-        max_wait -= 1
-        print(".", end="")
-        time.sleep(1)
+        dots += 1
+        time.sleep_ms(delay)
+        delay = min(delay * 2, 200)
     
-    print()
+    # Print the progress dots in one write instead of one per poll
+    print("." * dots)
     
     if wlan.isconnected():
         print("SUCCESS! Connected to WiFi")
@@ -1,21 +1,27 @@
 """
 Script to convert logo to Python string for embedding
+
+Writes logo.png as a base64 LOGO_BASE64 literal to logo_embedded.py, for
+pasting into a data: URI elsewhere. Nothing in this repo imports it; the
+Pico and the preview server both serve logo.png as-is.
 """
 
 import base64
 
-with open('Images/badgersolarracing_logo.jpeg', 'rb') as f:
-    logo_data = base64.b64encode(f.read()).decode('utf-8')
-    
-# Split into chunks for readability
+with open('logo.png', 'rb') as f:
+    logo_data = base64.b64encode(f.read())
+
+# Write 80-character lines straight from the encoded buffer
 chunk_size = 80
-logo_chunks = [logo_data[i:i+chunk_size] for i in range(0, len(logo_data), chunk_size)]
+mv = memoryview(logo_data)
+
+with open('logo_embedded.py', 'wb') as out:
+    out.write(b'LOGO_BASE64 = (\n')
+    for i in range(0, len(mv), chunk_size):
+        out.write(b'    "')
+        out.write(mv[i:i+chunk_size])
+        out.write(b'"\n')
+    out.write(b')\n')
+    out.write(b'\n# Total length: %d bytes\n' % len(logo_data))
 
-print('LOGO_BASE64 = (')
-for i, chunk in enumerate(logo_chunks):
-    if i < len(logo_chunks) - 1:
-        print(f'    "{chunk}"')
-    else:
-        print(f'    "{chunk}"')
-print(')')
-print(f'\n# Total length: {len(logo_data)} bytes')
+print(f'Wrote logo_embedded.py ({len(logo_data)} bytes of base64)')
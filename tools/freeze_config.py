@@ -0,0 +1,43 @@
+"""
+Script to bake wifi_config.txt and driverio_config.txt into a Python module
+that can be frozen into the firmware (see tools/manifest.py)
+"""
+
+DRIVERIO_KEYS = {
+    'DRIVERIO_IP': 'ip',
+    'DRIVERIO_USER': 'user',
+    'DRIVERIO_PASS': 'pass',
+    'PASSCODE': 'passcode',
+}
+
+
+def read_pairs(filename):
+    """Yield KEY, VALUE pairs from a KEY=VALUE config file."""
+    with open(filename, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                yield line.split('=', 1)
+
+
+wifi = {'ssid': None, 'password': None}
+for key, value in read_pairs('wifi_config.txt'):
+    if key == 'SSID':
+        wifi['ssid'] = value
+    elif key == 'PASSWORD':
+        wifi['password'] = value
+
+driverio = {}
+for key, value in read_pairs('driverio_config.txt'):
+    if key in DRIVERIO_KEYS:
+        driverio[DRIVERIO_KEYS[key]] = value
+if 'passcode' in driverio:
+    # main.py compares the passcode as bytes
+    driverio['passcode'] = driverio['passcode'].encode()
+
+with open('_config_frozen.py', 'w') as out:
+    out.write('# Generated by tools/freeze_config.py - do not commit (contains credentials)\n')
+    out.write(f'WIFI = {wifi!r}\n')
+    out.write(f'DRIVERIO = {driverio!r}\n')
+
+print('Wrote _config_frozen.py')
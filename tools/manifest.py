@@ -0,0 +1,21 @@
+"""
+MicroPython freeze manifest for the BSR Driver IO Remote Control firmware.
+
+Pass this file as FROZEN_MANIFEST when building the rp2 port so that main.py
+is compiled to bytecode at build time and executed directly from flash:
+
+    make BOARD=RPI_PICO_W FROZEN_MANIFEST=/path/to/tools/manifest.py
+"""
+
+# Keep the standard Pico W modules (networking, asyncio, ...)
+include("$(BOARD_DIR)/manifest.py")
+
+# Freeze the web server; boot.py runs it with `import main`
+module("main.py", base_path="..", opt=2)
+
+# Bake in the config files if tools/freeze_config.py has been run; otherwise
+# main.py falls back to reading wifi_config.txt / driverio_config.txt
+try:
+    module("_config_frozen.py", base_path="..", opt=2)
+except Exception:
+    pass